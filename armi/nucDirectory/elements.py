@@ -17,6 +17,9 @@ Deals with elements of the periodic table.
 """
 
 import os
+import sys
+
+import numpy
 
 from armi import context
 from armi.utils.units import HEAVY_METAL_CUTOFF_Z
@@ -25,6 +28,14 @@ byZ = {}
 byName = {}
 bySymbol = {}
 
+# parsed contents of elements.dat, cached so repeated factory() calls
+# (e.g. after a destroy() in testing) skip the file I/O and tokenization
+_elementRecords = None
+
+# dense Z-indexed list maintained alongside byZ; atomic numbers are packed
+# 1..~118 so plain list indexing beats dict hashing in per-nuclide loops
+_byZDense = []
+
 LANTHANIDE_ELEMENTS = [
     "LA",
     "CE",
@@ -65,6 +76,17 @@ class Element(object):
         nuclideBases for this element
     """
 
+    __slots__ = (
+        "z",
+        "symbol",
+        "name",
+        "standardWeight",
+        "nuclideBases",
+        "_naturalIsotopics",
+        "_isNaturallyOccurring",
+        "_smallestStableA",
+    )
+
     def __init__(self, z, symbol, name):
         r"""
         Creates an instance of an Element.
@@ -86,28 +108,26 @@ class Element(object):
         self.name = name
         self.standardWeight = None
         self.nuclideBases = []
+        self._naturalIsotopics = None
+        self._isNaturallyOccurring = None
+        self._smallestStableA = None
 
-        other = byZ.get(z, None)
-        if other is not None and other == self:
+        if byZ.get(z, None) is not None:
             raise Exception(
                 "Element with atomic weight {} already exists" "".format(self)
             )
         byZ[z] = self
         byName[name] = self
         bySymbol[symbol] = self
+        if z >= len(_byZDense):
+            _byZDense.extend([None] * (z + 1 - len(_byZDense)))
+        _byZDense[z] = self
 
     def __repr__(self):
         return "<Element {} {}>".format(self.symbol, self.z)
 
-    def __eq__(self, other):
-        return (
-            self.z == other.z
-            and self.symbol == other.symbol
-            and self.name == other.name
-        )
-
-    def __hash__(self):
-        return hash(self.name)
+    # elements are singletons per Z within the directory, so default identity
+    # comparison and hashing are both correct and faster than field-wise checks
 
     def __iter__(self):
         for nuc in self.nuclideBases:
@@ -115,28 +135,56 @@ class Element(object):
 
     def append(self, nuclide):
         self.nuclideBases.append(nuclide)
+        self._invalidateCache()
+
+    def _invalidateCache(self):
+        """Clear derived isotopic info after the nuclide base list changes."""
+        self._naturalIsotopics = None
+        self._isNaturallyOccurring = None
+        self._smallestStableA = None
 
     def isNaturallyOccurring(self):
         r"""
         Calculates the total natural abundance and if this value is zero returns False.
         If any isotopes are naturally occurring the total abundance will be >0 so it will return True
         """
-        totalAbundance = 0.0
-        for nuc in self.nuclideBases:
-            totalAbundance += nuc.abundance
-        return totalAbundance > 0.0
+        if self._isNaturallyOccurring is None:
+            totalAbundance = 0.0
+            for nuc in self.nuclideBases:
+                totalAbundance += nuc.abundance
+            self._isNaturallyOccurring = totalAbundance > 0.0
+        return self._isNaturallyOccurring
 
     def getNaturalIsotopics(self):
         """
         Return the nuclide bases of any naturally-occurring isotopes of this element.
 
+        The list is computed once and cached; adding a nuclide base resets it.
+
         Notes
         -----
         Some elements have no naturally-occurring isotopes (Tc, Pu, etc.). To
         allow this method to be used in loops it will simply return an
         empty list in these situations.
         """
-        return [nuc for nuc in self.nuclideBases if nuc.abundance > 0.0 and nuc.a > 0]
+        if self._naturalIsotopics is None:
+            self._naturalIsotopics = [
+                nuc for nuc in self.nuclideBases if nuc.abundance > 0.0 and nuc.a > 0
+            ]
+        return self._naturalIsotopics
+
+    def getSmallestStableA(self):
+        """
+        Return the smallest mass number among the naturally-occurring isotopes.
+
+        This anchors e.g. ENDF MAT numbering. Cached with the other derived
+        isotopic info; returns None for elements with no natural isotopes.
+        """
+        if self._smallestStableA is None:
+            naturals = self.getNaturalIsotopics()
+            if naturals:
+                self._smallestStableA = min(nuc.a for nuc in naturals)
+        return self._smallestStableA
 
     def isHeavyMetal(self):
         return self.z > HEAVY_METAL_CUTOFF_Z
@@ -165,7 +213,7 @@ def getName(z=None, symbol=None):
     if z:
         element = byZ[z]
     else:
-        element = byName[symbol.upper()]
+        element = bySymbol[symbol.upper()]
     return element.name
 
 
@@ -193,7 +241,7 @@ def getSymbol(z=None, name=None):
         element = byZ[z]
     else:
         element = byName[name.lower()]
-    return element.name
+    return element.symbol
 
 
 def getElementZ(symbol=None, name=None):
@@ -228,6 +276,19 @@ def getElementZ(symbol=None, name=None):
     return element.z
 
 
+def getElementByZ(z):
+    """
+    Get an element by atomic number via the dense Z-indexed list.
+
+    This avoids the dict hashing of ``byZ[z]`` and is intended for loops that
+    resolve an element once per nuclide.
+    """
+    element = _byZDense[z] if 0 < z < len(_byZDense) else None
+    if element is None:
+        raise KeyError("No element with atomic number {}".format(z))
+    return element
+
+
 def clearNuclideBases():
     """
     Delete all nuclide base links.
@@ -236,6 +297,7 @@ def clearNuclideBases():
     """
     for name, element in byName.items():
         element.nuclideBases = []
+        element._invalidateCache()  # pylint: disable=protected-access
 
 
 # method to renormalize the nuclide / element relationship
@@ -247,6 +309,7 @@ def destroy():
     byZ.clear()
     byName.clear()
     bySymbol.clear()
+    del _byZDense[:]
 
 
 def deriveNaturalWeights():
@@ -260,14 +323,52 @@ def deriveNaturalWeights():
     Abundances may not add exactly to 1.0 because they're read from measurements
     that have uncertainties.
     """
+    naturals = [
+        nb for element in byName.values() for nb in element.getNaturalIsotopics()
+    ]
+    if not naturals:
+        return
+    count = len(naturals)
+    z = numpy.fromiter((nb.z for nb in naturals), dtype=numpy.int64, count=count)
+    abundances = numpy.fromiter(
+        (nb.abundance for nb in naturals), dtype=numpy.float64, count=count
+    )
+    weights = numpy.fromiter(
+        (nb.weight for nb in naturals), dtype=numpy.float64, count=count
+    )
+    # scatter-add the weighted sums per atomic number in two C-level passes
+    numer = numpy.bincount(z, weights=abundances * weights)
+    denom = numpy.bincount(z, weights=abundances)  # should add roughly to 1.0
     for element in byName.values():
-        numer = 0.0
-        denom = 0.0
-        for nb in element.getNaturalIsotopics():
-            numer += nb.weight * nb.abundance
-            denom += nb.abundance  # should add roughly to 1.0
-        if numer:
-            element.standardWeight = numer / denom
+        if element.z < len(numer) and numer[element.z]:
+            element.standardWeight = float(numer[element.z] / denom[element.z])
+
+
+def _getElementRecords():
+    """
+    Read and cache the ``(z, symbol, name)`` records from ``elements.dat``.
+
+    The file is parsed at most once per process; reconstructing the elements
+    (e.g. after a :py:func:`destroy`) reuses the cached records.
+    """
+    global _elementRecords  # pylint: disable=global-statement
+    if _elementRecords is None:
+        records = []
+        # read all.dat -> z, symbol, name
+        with open(os.path.join(context.RES, "elements.dat"), "r") as f:
+            for line in f:
+                # read z, symbol, and name; cap the split at three tokens so the
+                # name is not re-tokenized
+                z, sym, name = line.split(None, 2)
+                records.append(
+                    (
+                        int(z),
+                        sys.intern(sym.upper()),
+                        sys.intern(name.strip().lower()),
+                    )
+                )
+        _elementRecords = tuple(records)
+    return _elementRecords
 
 
 def factory():
@@ -281,16 +382,8 @@ def factory():
         may lose their reference to the underlying :class:`Element`.
     """
     if len(byZ) == 0:
-        destroy()
-        # read all.dat -> z, symbol, name
-        with open(os.path.join(context.RES, "elements.dat"), "r") as f:
-            for line in f:
-                # read z, symbol, and name
-                lineData = line.split()
-                z = int(lineData[0])
-                sym = lineData[1].upper()
-                name = lineData[2].lower()
-                Element(z, sym, name)
+        for z, sym, name in _getElementRecords():
+            Element(z, sym, name)
         if nuclideRenormalization is not None:
             nuclideRenormalization()  # pylint: disable=not-callable
             # this is used as a method to ensure the nuclides are
@@ -100,10 +100,16 @@ Table of All nuclides:
 
 """
 
+import itertools
+import operator
 import os
-import yaml
+import pickle
+import sys
+import types
 import collections
 
+import numpy
+
 import armi
 from armi.nucDirectory import elements
 from armi.nucDirectory import transmutations
@@ -116,21 +122,57 @@ from armi.utils.units import HEAVY_METAL_CUTOFF_Z
 # directory.
 _burnChainImposed = False
 
+# set once factory() completes successfully; guards against re-running the
+# expensive load on every import-path touch of this module
+_initialized = False
+
+# while True, _addNuclideToIndices skips the derived indices that factory()
+# rebuilds in bulk once the data files are loaded
+_deferredIndexing = False
+
 instances = []
 
+# Mutable backing stores for the lookup dicts. The module-level names exported
+# below are live read-only views of these, so the directory can only be
+# modified through this module while outside readers always see current data.
+_byName = {}
+_byDBName = {}
+_byLabel = {}
+_byMccId = {}
+_byMcnpId = {}
+_byAAAZZZSId = {}
+_byZAS = {}
+
 # Dictionary of INuclides by the INuclide.name for fast indexing
-byName = {}
+byName = types.MappingProxyType(_byName)
+
+byDBName = types.MappingProxyType(_byDBName)
+
+byLabel = types.MappingProxyType(_byLabel)
 
-byDBName = {}
+byMccId = types.MappingProxyType(_byMccId)
 
-byLabel = {}
+byMcnpId = types.MappingProxyType(_byMcnpId)
 
-byMccId = {}
 
-byMcnpId = {}
+byAAAZZZSId = types.MappingProxyType(_byAAAZZZSId)
 
+# Dictionary of INuclides with z > 0 by (z, a, state); lumps and dummies all
+# share z == a == 0 and are only addressable by name
+byZAS = types.MappingProxyType(_byZAS)
 
-byAAAZZZSId = {}
+# lazily-built struct-of-arrays view of ``instances`` used for bulk queries;
+# invalidated whenever a new nuclide base is created
+_queryArrays = None
+
+# shared by the name/label builders; state indexes the meta-state suffix and
+# (a % 10) + 10 * state indexes the final label character
+_META_CHAR = ("", "M")
+_LABEL_DIGITS = "0123456789ABCDEFGHIJ"
+
+# the natural nuclides C and V lack isotopic MC2 data and so carry explicit
+# AAAZZZS IDs; every other elemental has none
+_NATURAL_AAAZZZS_IDS = {"C": "120060", "V": "510230"}
 
 # lookup table from https://t2.lanl.gov/nis/data/endf/endfvii-n.html
 BASE_ENDFB7_MAT_NUM = {
@@ -150,7 +192,7 @@ BASE_ENDFB7_MAT_NUM = {
 
 
 def isotopes(z):
-    return elements.byZ[z].nuclideBases
+    return elements.getElementByZ(z).nuclideBases
 
 
 def getIsotopics(nucName):
@@ -169,12 +211,20 @@ def getIsotopics(nucName):
 def fromName(name):
     r"""Get a nuclide from its name.
     """
-    matches = [nn for nn in instances if nn.name == name]
-    if len(matches) != 1:
-        raise errors.nuclides_TooManyOrTooFew_number_MatchesForNuclide_name(
-            len(matches), name
-        )
-    return matches[0]
+    try:
+        return _byName[name]
+    except KeyError:
+        raise errors.nuclides_TooManyOrTooFew_number_MatchesForNuclide_name(0, name)
+
+
+def fromZAS(z, a, state=0):
+    r"""Get a nuclide base from its atomic number, mass number, and state.
+
+    This is the indexed equivalent of
+    ``single(lambda nb: nb.z == z and nb.a == a and nb.state == state)``
+    and raises a ``KeyError`` when no such nuclide base exists.
+    """
+    return byZAS[z, a, state]
 
 
 def nucNameFromDBName(dbName):
@@ -231,6 +281,76 @@ def where(predicate):
             yield (nuc)
 
 
+def _getQueryArrays():
+    """
+    Return ``(z, a, state, abundance, weight)`` numpy arrays parallel to ``instances``.
+
+    The arrays are built on first use and rebuilt whenever a nuclide base has
+    been added, so vectorized filters see a consistent view of the directory.
+    """
+    global _queryArrays  # pylint: disable=global-statement
+    if _queryArrays is None:
+        count = len(instances)
+        _queryArrays = (
+            numpy.fromiter((nb.z for nb in instances), dtype=numpy.int16, count=count),
+            numpy.fromiter((nb.a for nb in instances), dtype=numpy.int16, count=count),
+            numpy.fromiter(
+                (nb.state for nb in instances), dtype=numpy.int8, count=count
+            ),
+            numpy.fromiter(
+                (nb.abundance for nb in instances), dtype=numpy.float64, count=count
+            ),
+            numpy.fromiter(
+                (nb.weight for nb in instances), dtype=numpy.float64, count=count
+            ),
+        )
+    return _queryArrays
+
+
+def whereMask(mask):
+    r"""Get the :py:class:`INuclides <INuclide>` selected by a boolean mask.
+
+    The mask must be aligned with :py:data:`instances`, e.g. one produced by
+    comparing against the arrays from :py:func:`_getQueryArrays`.
+    """
+    return [instances[i] for i in numpy.nonzero(mask)[0]]
+
+
+def whereVector(mask):
+    r"""Get ``(z, a, state, abundance, weight)`` arrays for the masked nuclides.
+
+    Companion to :py:func:`whereMask` for callers that want to continue with
+    array arithmetic (e.g. abundance-weighted sums) rather than nuclide
+    objects.
+    """
+    return tuple(arr[mask] for arr in _getQueryArrays())
+
+
+def isHeavyMetalMask():
+    r"""Get a boolean mask over :py:data:`instances` marking heavy metal nuclides.
+
+    One vectorized compare against the atomic number array replaces a Python
+    loop of per-nuclide ``isHeavyMetal()`` calls; feed the result to
+    :py:func:`whereMask` or combine it with other masks.
+    """
+    return _getQueryArrays()[0] > HEAVY_METAL_CUTOFF_Z
+
+
+def byMassNumber(a):
+    r"""Get all :py:class:`INuclides <INuclide>` with the given mass number.
+
+    This is a vectorized equivalent of ``where(lambda nb: nb.a == a)``; the
+    comparison runs over a contiguous array instead of touching every
+    nuclide object.
+    """
+    return whereMask(_getQueryArrays()[1] == a)
+
+
+def byAtomicNumber(z):
+    r"""Get all :py:class:`INuclides <INuclide>` with the given atomic number."""
+    return whereMask(_getQueryArrays()[0] == z)
+
+
 def single(predicate):
     r"""Get a single :py:class:`INuclide` meeting the specified condition.
 
@@ -257,12 +377,12 @@ def single(predicate):
 
 def changeLabel(nuclideBase, newLabel):
     nuclideBase.label = newLabel
-    byLabel[newLabel] = nuclideBase
+    _byLabel[newLabel] = nuclideBase
 
 
 def __readRiplNuclides():
     """
-    Initialize all nuclides with experimentally-measured masses.
+    Initialize all nuclides with experimentally-measured masses and natural abundances.
 
     This includes roughly 4000 nuclides and should represent anything we ever
     want to model. This builds the large set of NuclideBases available.
@@ -273,28 +393,65 @@ def __readRiplNuclides():
     from armi.nuclearDataIO import ripl
 
     elements.clearNuclideBases()
-    for z, a, symbol, mass, _err in ripl.readFRDMMassFile(
-        os.path.join(armi.context.RES, "ripl-mass-frdm95.dat")
+    bySymbol = elements.bySymbol  # avoid a module attribute lookup per record
+    for z, a, symbol, mass, abundance in ripl.readMassAndAbundance(
+        os.path.join(armi.context.RES, "ripl-mass-frdm95.dat"),
+        os.path.join(armi.context.RES, "ripl-abundance.dat"),
     ):
         if z == 0 and a == 1:
             # skip the neutron
             continue
-        element = elements.bySymbol[symbol.upper()]
-        NuclideBase(element, a, mass, 0, 0, None)
+        element = bySymbol[symbol]
+        NuclideBase(element, a, mass, abundance, 0, None)
 
 
-def __readRiplAbundance():
+def _loadYaml(stream):
     """
-    Read natural abundances of any natural nuclides.
+    Parse a YAML stream, importing yaml on first use.
 
-    This adjusts already-existing NuclideBases and Elements with the new information.
+    Importing is deferred so that the common startup path, which reads the
+    pickled sidecar cache instead of any YAML, never pays for it.
     """
-    from armi.nuclearDataIO import ripl
+    import yaml
+
+    try:
+        # the libyaml C parser is much faster than the pure-Python loaders and
+        # the data files here contain only plain scalars, maps, and sequences
+        from yaml import CSafeLoader as loader
+    except ImportError:
+        from yaml import SafeLoader as loader
+
+    return yaml.load(stream, Loader=loader)
 
-    with open(os.path.join(armi.context.RES, "ripl-abundance.dat")) as ripl_abundance:
-        for _z, a, sym, percent, _err in ripl.readAbundanceFile(ripl_abundance):
-            nb = byName[sym + "{}".format(a)]
-            nb.abundance = percent / 100.0
+
+def _loadMc2NuclideData():
+    """
+    Load the mc2Nuclides.yaml data, preferring a pickled sidecar cache.
+
+    The YAML ships with the package and only changes when the package does, so
+    the parsed dict is cached in the user's app-data directory keyed on the
+    YAML's mtime and size. Unpickling plain scalars is much faster than YAML
+    parsing; any problem with the cache just falls back to the YAML path.
+    """
+    yamlPath = os.path.join(armi.context.RES, "mc2Nuclides.yaml")
+    stat = os.stat(yamlPath)
+    cacheKey = (stat.st_mtime, stat.st_size)
+    picklePath = os.path.join(armi.context.APP_DATA, "mc2Nuclides.pkl")
+    try:
+        with open(picklePath, "rb") as pkl:
+            cachedKey, data = pickle.load(pkl)
+        if cachedKey == cacheKey:
+            return data
+    except (OSError, EOFError, pickle.UnpicklingError, ValueError):
+        pass
+    with open(yamlPath, "r") as mc2Nucs:
+        data = _loadYaml(mc2Nucs)
+    try:
+        with open(picklePath, "wb") as pkl:
+            pickle.dump((cacheKey, data), pkl, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass  # e.g. read-only install; just re-parse the YAML next time
+    return data
 
 
 def __readMc2Nuclides():
@@ -306,8 +463,7 @@ def __readMc2Nuclides():
     This assigns MC2 labels and often adds metastable versions of nuclides
     that have already been added from RIPL.
     """
-    with open(os.path.join(armi.context.RES, "mc2Nuclides.yaml"), "r") as mc2Nucs:
-        mc2Nuclides = yaml.load(mc2Nucs, Loader=yaml.FullLoader)
+    mc2Nuclides = _loadMc2NuclideData()
     # now add the mc2 specific nuclideBases, and correct the mc2Ids when a > 0 and state = 0
     for name, data in mc2Nuclides.items():
         z = data["z"]
@@ -315,7 +471,7 @@ def __readMc2Nuclides():
         state = data["state"]
         iid = data["id"]
 
-        element = elements.byZ[z] if z > 0 else None
+        element = elements.getElementByZ(z) if z > 0 else None
         if z == 0:
             weight = data["weight"]
             if "LFP" in name:
@@ -331,19 +487,11 @@ def __readMc2Nuclides():
             # state == 0 nuclide *should* already exist
             needToAdd = True
             if state == 0:
-                clide = [
-                    nn
-                    for nn in element.nuclideBases
-                    if nn.z == z and nn.a == a and nn.state == state
-                ]
-                if len(clide) > 1:
-                    raise ValueError(
-                        "More than 1 nuclide meets specific criteria: {}".format(clide)
-                    )
-                needToAdd = len(clide) == 0
+                clide = _byZAS.get((z, a, state), None)
+                needToAdd = clide is None
                 if not needToAdd and iid:
-                    clide[0].mc2id = iid
-                    byMccId[iid] = clide[0]
+                    clide.mc2id = sys.intern(iid)
+                    _byMccId[clide.mc2id] = clide
             # state != 0, nuclide should not exist, create it
             if needToAdd:
                 NuclideBase(
@@ -354,19 +502,25 @@ def __readMc2Nuclides():
     # This is a typical approach in many reactor codes including MCNP since you almost always
     # are interested in AM242M.
     am242g = byName["AM242"]
+    am242m = byName["AM242M"]
     am242g.name = "AM242G"
-    am242 = byName["AM242M"]
-    am242.name = "AM242"
-    am242.weight = am242g.weight  # use RIPL mass for metastable too
-    byName[am242.name] = am242
-    byDBName[am242.getDatabaseName()] = am242
-    byName["AM242G"] = am242g
-    byDBName[byName["AM242G"].getDatabaseName()] = am242g
+    am242m.name = "AM242"
+    # drop any database names cached under the pre-rename names
+    am242g._dbName = None  # pylint: disable=protected-access
+    am242m._dbName = None  # pylint: disable=protected-access
+    am242m.weight = am242g.weight  # use RIPL mass for metastable too
+    _byName["AM242"] = am242m
+    _byName["AM242G"] = am242g
+    _byDBName[am242m.getDatabaseName()] = am242m
+    _byDBName[am242g.getDatabaseName()] = am242g
 
 
 def getDepletableNuclides(activeNuclides, obj):
     """Get nuclides in this object that are in the burn chain."""
-    return sorted(set(activeNuclides) & set(obj.getNuclides()))
+    if not isinstance(activeNuclides, collections.abc.Set):
+        # covers set, frozenset, and the OrderedSet used by blueprints
+        activeNuclides = set(activeNuclides)
+    return sorted(nuc for nuc in set(obj.getNuclides()) if nuc in activeNuclides)
 
 
 def imposeBurnChain(burnChainStream):
@@ -388,9 +542,11 @@ def imposeBurnChain(burnChainStream):
         )
         factory(True)
     _burnChainImposed = True
-    burnData = yaml.load(burnChainStream, Loader=yaml.FullLoader)
+    burnData = _loadYaml(burnChainStream)
+    nucsByName = _byName  # local binding for the per-entry lookups
     for nucName, burnInfo in burnData.items():
-        nuclide = byName[nucName]
+        # an unknown nuclide in the burn chain should still fail loudly
+        nuclide = nucsByName[nucName]
         # think of this protected stuff as "module level protection" rather than class.
         nuclide._processBurnData(burnInfo)  # pylint: disable=protected-access
 
@@ -416,58 +572,117 @@ def factory(force=False):
         original :py:class:`INuclide` will not update their references, and will probably fail.
     """
     # this intentionally clears and reinstantiates all nuclideBases
-    global instances  # pylint: disable=global-statement
+    global _initialized  # pylint: disable=global-statement
     global _burnChainImposed  # pylint: disable=global-statement
-    if force or len(instances) == 0:
-        _burnChainImposed = False
-        # make sure the elements actually exist...
-        elements.factory()
-        del instances[:]  # there is no .clear() for a list
-        byName.clear()
-        byDBName.clear()
-        byLabel.clear()
-        byMccId.clear()
-        byMcnpId.clear()
-        byAAAZZZSId.clear()
+    global _deferredIndexing  # pylint: disable=global-statement
+    if _initialized and not force:
+        return
+    _burnChainImposed = False
+    # make sure the elements actually exist...
+    elements.factory()
+    del instances[:]  # there is no .clear() for a list
+    _byName.clear()
+    _byDBName.clear()
+    _byLabel.clear()
+    _byMccId.clear()
+    _byMcnpId.clear()
+    _byAAAZZZSId.clear()
+    _byZAS.clear()
+    _deferredIndexing = True
+    try:
+        # reads the masses and natural abundances in one fused pass
         __readRiplNuclides()
-        __readRiplAbundance()
         # load the mc2Nuclide.json file. This will be used to supply nuclide IDs
         __readMc2Nuclides()
-        elements.deriveNaturalWeights()
+    finally:
+        _deferredIndexing = False
+    _rebuildDerivedIndices()
+    elements.deriveNaturalWeights()
+    # only mark success at the end so a failed load is retried rather than
+    # leaving a partially-built directory behind a true sentinel
+    _initialized = True
 
 
 def _renormalizeElementRelationship():
-    for nuc in instances:
-        if nuc.element is not None:
-            nuc.element = elements.byZ[nuc.z]
-            nuc.element.append(nuc)
+    # group the nuclides by Z with one stable sort so each element is resolved
+    # once and its nuclide bases arrive via a single extend
+    byZ = operator.attrgetter("z")
+    withElements = sorted(
+        (nuc for nuc in instances if nuc.element is not None), key=byZ
+    )
+    for z, group in itertools.groupby(withElements, key=byZ):
+        element = elements.getElementByZ(z)
+        nucs = list(group)
+        for nuc in nucs:
+            nuc.element = element
+        element.nuclideBases.extend(nucs)
+        element._invalidateCache()  # pylint: disable=protected-access
 
 
 elements.nuclideRenormalization = _renormalizeElementRelationship
 
 
 def _addNuclideToIndices(nuc):
+    global _queryArrays  # pylint: disable=global-statement
+    _queryArrays = None
     instances.append(nuc)
-    byName[nuc.name] = nuc
-    byDBName[nuc.getDatabaseName()] = nuc
-    byLabel[nuc.label] = nuc
-    if nuc.mc2id:
-        byMccId[nuc.mc2id] = nuc
-    mc3 = nuc.getMcc3Id()
-    if mc3:
-        byMccId[mc3] = nuc
+    _byName[nuc.name] = nuc
+    if nuc.z:
+        _byZAS[nuc.z, nuc.a, nuc.state] = nuc
+    if _deferredIndexing:
+        # factory() rebuilds the derived indices in one batched pass after the
+        # bulk load; only the indices the loaders themselves read stay live
+        return
+    _byDBName[nuc.getDatabaseName()] = nuc
+    _byLabel[nuc.label] = nuc
+    _byMccId.update(
+        (mccId, nuc) for mccId in (nuc.mc2id, nuc.getMcc3Id()) if mccId
+    )
     if isinstance(nuc, IMcnpNuclide):
-        byMcnpId[nuc.getMcnpId()] = nuc
-        try:
-            byAAAZZZSId[nuc.getAAAZZZSId()] = nuc
-        except AttributeError:
-            pass
+        _byMcnpId[nuc.getMcnpId()] = nuc
+        aaazzzs = nuc.getAAAZZZSId()
+        if aaazzzs:
+            _byAAAZZZSId[aaazzzs] = nuc
+
+
+def _rebuildDerivedIndices():
+    """
+    Rebuild the name-derived lookup dicts from ``instances`` in bulk.
+
+    Doing this once after the data files load replaces roughly 24000
+    interleaved per-nuclide dict inserts with a handful of C-level dict
+    updates, and naturally reflects any renames done during loading (e.g. the
+    AM242/AM242M swap).
+    """
+    _byDBName.clear()
+    _byLabel.clear()
+    _byMccId.clear()
+    _byMcnpId.clear()
+    _byAAAZZZSId.clear()
+    _byDBName.update((nuc.getDatabaseName(), nuc) for nuc in instances)
+    _byLabel.update((nuc.label, nuc) for nuc in instances)
+    mccPairs = []
+    for nuc in instances:
+        if nuc.mc2id:
+            mccPairs.append((nuc.mc2id, nuc))
+        mc3 = nuc.getMcc3Id()
+        if mc3:
+            mccPairs.append((mc3, nuc))
+    _byMccId.update(mccPairs)
+    mcnpNucs = [nuc for nuc in instances if isinstance(nuc, IMcnpNuclide)]
+    _byMcnpId.update((nuc.getMcnpId(), nuc) for nuc in mcnpNucs)
+    for nuc in mcnpNucs:
+        aaazzzs = nuc.getAAAZZZSId()
+        if aaazzzs:
+            _byAAAZZZSId[aaazzzs] = nuc
 
 
 class IMcnpNuclide(object):
     """Interface which defines the contract for getMcnpId.
     """
 
+    __slots__ = ()
+
     def getMcnpId(self):
         """
         Abstract implementation of get MCNP ID.
@@ -484,6 +699,10 @@ class IMcnpNuclide(object):
 class NuclideInterface(object):
     """An abstract nuclide implementation which defining various methods required for a nuclide object."""
 
+    # empty so the INuclide branch of the hierarchy can stay dict-free;
+    # NuclideWrapper declares no slots and keeps a per-instance dict
+    __slots__ = ()
+
     def getDatabaseName(self):
         """Get the name of the nuclide used in the database (i.e. "nPu239")"""
         raise NotImplementedError
@@ -642,7 +861,31 @@ class INuclide(NuclideInterface):
         This should probably be moved at some point.
     """
 
-    fissile = ["U235", "PU239", "PU241", "AM242M", "CM244", "U233"]
+    # thousands of these live for the whole run, so skip the per-instance dict
+    __slots__ = (
+        "z",
+        "a",
+        "state",
+        "decays",
+        "trans",
+        "weight",
+        "abundance",
+        "name",
+        "label",
+        "element",
+        "mc2id",
+        "nuSF",
+        "_hash",
+        "_dbName",
+        "_mcc3Id",
+        "_mcnpId",
+        "_serpentId",
+        "_aaazzzsId",
+        "_endfMatNum",
+    )
+
+    # frozenset so isFissile is a single hashed probe in reactor-wide loops
+    fissile = frozenset(("U235", "PU239", "PU241", "AM242M", "CM244", "U233"))
     TRANSMUTATION = "transmutation"
     DECAY = "decay"
     SPONTANEOUS_FISSION = "nuSF"
@@ -662,23 +905,37 @@ class INuclide(NuclideInterface):
         self.trans = []
         self.weight = weight
         self.abundance = abundance
-        self.name = name
-        self.label = label
-        self.element = self.__dict__.get("element", None)
-        self.mc2id = mc2id
+        # names and labels are used as dict keys all over the code; interning
+        # them makes those lookups resolve on pointer comparison
+        self.name = sys.intern(name) if name else name
+        self.label = sys.intern(label) if label else label
+        self.element = getattr(self, "element", None)
+        self.mc2id = sys.intern(mc2id) if mc2id else mc2id
         self.nuSF = 0.0
+        # (z, a, state) packed into one int; z, a, and state comfortably fit
+        # their fields, so hashing and ordering need no tuple allocation and
+        # the comparison stays lexicographic in (z, a, state)
+        self._hash = (z << 16) | (a << 4) | state
+        # lazily computed ID strings; these are requested for every nuclide in
+        # every block, so they are built once and reused
+        self._dbName = None
+        self._mcc3Id = None
+        self._mcnpId = None
+        self._serpentId = None
+        self._aaazzzsId = None
+        self._endfMatNum = None
 
         # depletion-ready attributes
         _addNuclideToIndices(self)
 
     def __hash__(self):
-        return hash((self.a, self.z, self.state))
+        return self._hash
 
     def __reduce__(self):
         return fromName, (self.name,)
 
     def __lt__(self, other):
-        return (self.z, self.a, self.state) < (other.z, other.a, other.state)
+        return self._hash < other._hash  # pylint: disable=protected-access
 
     def _processBurnData(self, burnInfo):
         """
@@ -701,20 +958,9 @@ class INuclide(NuclideInterface):
                         self, nuclideBurnCategory.keys()
                     )
                 )
-            nuclideBurnType = list(nuclideBurnCategory.keys())[0]
-            if nuclideBurnType == self.TRANSMUTATION:
-                self.trans.append(
-                    transmutations.Transmutation(
-                        self, nuclideBurnCategory[nuclideBurnType]
-                    )
-                )
-            elif nuclideBurnType == self.DECAY:
-                self.decays.append(
-                    transmutations.DecayMode(self, nuclideBurnCategory[nuclideBurnType])
-                )
-            elif nuclideBurnType == self.SPONTANEOUS_FISSION:
-                self.nuSF = nuclideBurnCategory[nuclideBurnType]
-            else:
+            nuclideBurnType = next(iter(nuclideBurnCategory))
+            handler = self._BURN_HANDLERS.get(nuclideBurnType)
+            if handler is None:
                 raise Exception(
                     "Undefined Burn Data {} for {}. Expected {}, {}, or {}."
                     "".format(
@@ -725,6 +971,24 @@ class INuclide(NuclideInterface):
                         self.SPONTANEOUS_FISSION,
                     )
                 )
+            handler(self, nuclideBurnCategory[nuclideBurnType])
+
+    def _addTransmutation(self, data):
+        self.trans.append(transmutations.Transmutation(self, data))
+
+    def _addDecayMode(self, data):
+        self.decays.append(transmutations.DecayMode(self, data))
+
+    def _setSpontaneousFission(self, nuSF):
+        self.nuSF = nuSF
+
+    # maps a burn-chain entry type to its handler; one dict probe instead of a
+    # chain of string comparisons per entry
+    _BURN_HANDLERS = {
+        TRANSMUTATION: _addTransmutation,
+        DECAY: _addDecayMode,
+        SPONTANEOUS_FISSION: _setSpontaneousFission,
+    }
 
     def getDecay(self, decayType):
         r"""Get a :py:class:`~armi.nucDirectory.transmutations.DecayMode`.
@@ -779,7 +1043,9 @@ class INuclide(NuclideInterface):
 
     def getDatabaseName(self):
         """Get the name of the nuclide used in the database (i.e. "nPu239")"""
-        return "n{}".format(self.name.capitalize())
+        if self._dbName is None:
+            self._dbName = f"n{self.name.capitalize()}"
+        return self._dbName
 
     def getMcc3Id(self):
         r"""Gets the MC**2-v3 nuclide ID.
@@ -809,6 +1075,8 @@ class NuclideBase(INuclide, IMcnpNuclide):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, element, a, weight, abundance, state, mc2id):
         IMcnpNuclide.__init__(self)
         self.element = element
@@ -833,8 +1101,7 @@ class NuclideBase(INuclide, IMcnpNuclide):
     @staticmethod
     def _createName(element, a, state):
         # state is either 0 or 1, so some nuclides will get an M at the end
-        metaChar = ["", "M"]
-        return "{}{}{}".format(element.symbol, a, metaChar[state])
+        return f"{element.symbol}{a}{_META_CHAR[state]}"
 
     @staticmethod
     def _createLabel(element, a, state):
@@ -851,9 +1118,9 @@ class NuclideBase(INuclide, IMcnpNuclide):
         # the division by 10 removes the last digit.
         firstTwoDigits = (a % (10 ** (4 - len(element.symbol)))) // 10
         # the last digit is either 0-9 if state=0, or A-J if state=1
-        lastDigit = "0123456789" "ABCDEFGHIJ"[(a % 10) + state * 10]
+        lastDigit = _LABEL_DIGITS[(a % 10) + state * 10]
 
-        return "{}{}{}".format(element.symbol, firstTwoDigits, lastDigit)
+        return f"{element.symbol}{firstTwoDigits}{lastDigit}"
 
     def getNaturalIsotopics(self):
         """Gets the natural isotopics root :py:class:`~elements.Element`.
@@ -883,12 +1150,13 @@ class NuclideBase(INuclide, IMcnpNuclide):
         --------
         :meth:`INuclide.getMcc3Id`
         """
-        base = ""
-        if self.state > 0:
-            base = "{}{}M".format(self.element.symbol, self.a % 100)
-        else:
-            base = "{}{}".format(self.element.symbol, self.a)
-        return "{:_<5}7".format(base)
+        if self._mcc3Id is None:
+            if self.state > 0:
+                base = f"{self.element.symbol}{self.a % 100}M"
+            else:
+                base = f"{self.element.symbol}{self.a}"
+            self._mcc3Id = f"{base:_<5}7"
+        return self._mcc3Id
 
     def getMcnpId(self):
         """
@@ -900,21 +1168,23 @@ class NuclideBase(INuclide, IMcnpNuclide):
             The MCNP ID e.g. ``92235``, ``94239``, ``6000``
 
         """
-        z, a = self.z, self.a
-
-        if z == 95 and a == 242:
-            # Am242 has special rules
-            if self.state != 1:
-                # MCNP uses base state for the common metastable state AM242M , so AM242M is just 95242
-                # AM242 base state is called 95642 (+400) in mcnp.
-                # see https://mcnp.lanl.gov/pdf_files/la-ur-08-1999.pdf
-                # New ACE-Formatted Neutron and Proton Libraries Based on ENDF/B-VII.0
-                a += 300 + 100 * max(self.state, 1)
-        elif self.state > 0:
-            # in general mcnp adds 300 + 100*m to the Z number for metastables. see above source
-            a += 300 + 100 * self.state
-
-        return "{z:d}{a:03d}".format(z=z, a=a)
+        if self._mcnpId is None:
+            z, a = self.z, self.a
+
+            if z == 95 and a == 242:
+                # Am242 has special rules
+                if self.state != 1:
+                    # MCNP uses base state for the common metastable state AM242M , so AM242M is just 95242
+                    # AM242 base state is called 95642 (+400) in mcnp.
+                    # see https://mcnp.lanl.gov/pdf_files/la-ur-08-1999.pdf
+                    # New ACE-Formatted Neutron and Proton Libraries Based on ENDF/B-VII.0
+                    a += 300 + 100 * max(self.state, 1)
+            elif self.state > 0:
+                # in general mcnp adds 300 + 100*m to the Z number for metastables. see above source
+                a += 300 + 100 * self.state
+
+            self._mcnpId = f"{z}{a:03d}"
+        return self._mcnpId
 
     def getAAAZZZSId(self):
         """
@@ -926,12 +1196,10 @@ class NuclideBase(INuclide, IMcnpNuclide):
             The MCNP ID e.g. ``2350920``, ``2390940``, ``1200600``
 
         """
-
-        aaa = "{}".format(self.a)
-        zzz = "{0:03}".format(self.z)
-        s = "1" if self.state > 0 else "0"
-
-        return "{}{}{}".format(aaa, zzz, s)
+        if self._aaazzzsId is None:
+            s = "1" if self.state > 0 else "0"
+            self._aaazzzsId = f"{self.a}{self.z:03d}{s}"
+        return self._aaazzzsId
 
     def getSerpentId(self):
         """
@@ -943,8 +1211,10 @@ class NuclideBase(INuclide, IMcnpNuclide):
             The ID of this nuclide based on it's elemental name, weight,
             and state, eg ``U-235``, ``Te-129m``,
         """
-        symbol = self.element.symbol.capitalize()
-        return "{}-{}{}".format(symbol, self.a, "m" if self.state else "")
+        if self._serpentId is None:
+            symbol = self.element.symbol.capitalize()
+            self._serpentId = f"{symbol}-{self.a}{'m' if self.state else ''}"
+        return self._serpentId
 
     def getEndfMatNum(self):
         """
@@ -963,25 +1233,25 @@ class NuclideBase(INuclide, IMcnpNuclide):
             The MAT number e.g. ``9237`` for U238
 
         """
-        z, a = self.z, self.a
-        if self.element.symbol in BASE_ENDFB7_MAT_NUM:
-            # no stable isotopes (or other special case). Use lookup table
-            smallestStableA = BASE_ENDFB7_MAT_NUM[self.element.symbol]
-        else:
-            naturalIsotopes = self.getNaturalIsotopics()
-            if naturalIsotopes:
-                smallestStableA = min(
-                    ni.a for ni in naturalIsotopes
-                )  # no guarantee they were sorted
-            else:
-                raise KeyError("Nuclide {0} is unknown in the MAT number lookup")
+        if self._endfMatNum is None:
+            z, a = self.z, self.a
+            # one probe covers the no-stable-isotope special cases
+            smallestStableA = BASE_ENDFB7_MAT_NUM.get(self.element.symbol)
+            if smallestStableA is None:
+                smallestStableA = self.element.getSmallestStableA()
+                if smallestStableA is None:
+                    raise KeyError("Nuclide {0} is unknown in the MAT number lookup")
 
-        isotopeNum = (a - smallestStableA) * 3 + self.state + 25
-        mat = z * 100 + isotopeNum
-        return "{0}".format(mat)
+            isotopeNum = (a - smallestStableA) * 3 + self.state + 25
+            mat = z * 100 + isotopeNum
+            self._endfMatNum = str(mat)
+        return self._endfMatNum
 
 
 class DummyNuclideBase(INuclide):
+
+    __slots__ = ()
+
     def __init__(self, name, mc2id, weight):
         INuclide.__init__(
             self, 0, 0, 0, weight, 0.0, name, "DMP" + name[4], mc2id  # z  # a  # state
@@ -993,21 +1263,20 @@ class DummyNuclideBase(INuclide):
         )
 
     def getNaturalIsotopics(self):
-        r"""Gets the natural isotopics, an empty iterator.
+        r"""Gets the natural isotopics, an empty tuple.
 
         Gets the naturally occurring nuclides for this nuclide.
 
         Returns
         -------
-        empty: iterator
-            An empty generator
+        empty: tuple
+            An empty tuple; no allocation per call.
 
         See Also
         --------
         :meth:`INuclide.getNaturalIsotopics`
         """
-        return
-        yield
+        return ()
 
     def getMcc3Id(self):
         r"""Gets the MC**2-v3 nuclide ID.
@@ -1025,6 +1294,9 @@ class DummyNuclideBase(INuclide):
 
 
 class LumpNuclideBase(INuclide):
+
+    __slots__ = ()
+
     def __init__(self, name, z, mc2id, weight):
         INuclide.__init__(self, z, 0, 0, weight, 0.0, name, name[1:], mc2id)
 
@@ -1034,21 +1306,20 @@ class LumpNuclideBase(INuclide):
         )
 
     def getNaturalIsotopics(self):
-        r"""Gets the natural isotopics, an empty iterator.
+        r"""Gets the natural isotopics, an empty tuple.
 
         Gets the naturally occurring nuclides for this nuclide.
 
         Returns
         -------
-        empty: iterator
-            An empty generator
+        empty: tuple
+            An empty tuple; no allocation per call.
 
         See Also
         --------
         :meth:`INuclide.getNaturalIsotopics`
         """
-        return
-        yield
+        return ()
 
     def getMcc3Id(self):
         r"""Gets the MC**2-v3 nuclide ID.
@@ -1066,6 +1337,9 @@ class LumpNuclideBase(INuclide):
 
 
 class NaturalNuclideBase(INuclide, IMcnpNuclide):
+
+    __slots__ = ()
+
     def __init__(self, name, element, mc2id):
         self.element = element
         INuclide.__init__(
@@ -1073,12 +1347,15 @@ class NaturalNuclideBase(INuclide, IMcnpNuclide):
             element.z,
             0,
             0,
-            sum([nn.weight * nn.abundance for nn in element.getNaturalIsotopics()]),
+            # no temporary list; left-to-right accumulation keeps results
+            # bit-identical with the per-isotope sums used elsewhere
+            sum(nn.weight * nn.abundance for nn in element.getNaturalIsotopics()),
             1.0,
             name,
             name,
             mc2id,
         )
+        self._aaazzzsId = _NATURAL_AAAZZZS_IDS.get(element.symbol)
         self.element.append(self)
 
     def __repr__(self):
@@ -1114,7 +1391,9 @@ class NaturalNuclideBase(INuclide, IMcnpNuclide):
         --------
         :meth:`INuclide.getMcc3Id`
         """
-        return "{:_<5}7".format(self.element.symbol)
+        if self._mcc3Id is None:
+            self._mcc3Id = f"{self.element.symbol:_<5}7"
+        return self._mcc3Id
 
     def getMcnpId(self):
         """Gets the MCNP ID for this element.
@@ -1124,7 +1403,9 @@ class NaturalNuclideBase(INuclide, IMcnpNuclide):
         id : str
             The MCNP ID e.g. ``1000``, ``92000``. Not zero-padded on the left.
         """
-        return "{0:d}000".format(self.z)
+        if self._mcnpId is None:
+            self._mcnpId = f"{self.z}000"
+        return self._mcnpId
 
     def getAAAZZZSId(self):
         """Gets the AAAZZZS ID for a few elements.
@@ -1133,14 +1414,9 @@ class NaturalNuclideBase(INuclide, IMcnpNuclide):
         -----
         the natural nuclides 'C' and 'V' do not have isotopic nuclide data for MC2 so sometimes they tag along in the
         list of active nuclides. This method is designed to fail in the same as if there was not getAAAZZZSId method
-        defined.
+        defined. The ID (or None) is resolved once at construction.
         """
-        if self.element.symbol == "C":
-            return "120060"
-        elif self.element.symbol == "V":
-            return "510230"
-        else:
-            return None
+        return self._aaazzzsId
 
     def getSerpentId(self):
         """Gets the SERPENT ID for this natural nuclide.
@@ -1150,7 +1426,9 @@ class NaturalNuclideBase(INuclide, IMcnpNuclide):
         id: str
             SERPENT ID: ``C-nat``, `Fe-nat``
         """
-        return "{}-nat".format(self.element.symbol.capitalize())
+        if self._serpentId is None:
+            self._serpentId = f"{self.element.symbol.capitalize()}-nat"
+        return self._serpentId
 
     def getEndfMatNum(self):
         """Get the ENDF mat number for this element."""
@@ -1162,7 +1440,7 @@ class NaturalNuclideBase(INuclide, IMcnpNuclide):
                     self
                 )
             )
-        return "{0}".format(self.z * 100)
+        return str(self.z * 100)
 
 
 def getDefaultNuclideFlags():
@@ -1241,9 +1519,13 @@ def initReachableActiveNuclidesThroughBurnChain(numberDensityDict, activeNuclide
     """
     missingActiveNuclides = set()
     memo = set()
-    difference = set(numberDensityDict).difference(memo)
-    while any(difference):
-        nuclide = difference.pop()
+    # worklist of nuclides still to visit; products discovered along the way
+    # are appended so the chain is walked without re-diffing the whole dict
+    worklist = collections.deque(numberDensityDict)
+    while worklist:
+        nuclide = worklist.popleft()
+        if nuclide in memo:
+            continue
         memo.add(nuclide)
         # Skip the nuclide if it is not `active` in the burn-chain
         if not nuclide in activeNuclides:
@@ -1256,12 +1538,11 @@ def initReachableActiveNuclidesThroughBurnChain(numberDensityDict, activeNuclide
                 productNuclide = interaction.getPreferredProduct(activeNuclides)
                 if productNuclide not in numberDensityDict:
                     numberDensityDict[productNuclide] = 0.0
+                    worklist.append(productNuclide)
             except KeyError:
                 # Keep track of the first production nuclide
                 missingActiveNuclides.add(interaction.productNuclides)
 
-        difference = set(numberDensityDict).difference(memo)
-
     if missingActiveNuclides:
         _failOnMissingActiveNuclides(missingActiveNuclides)
 
@@ -142,6 +142,31 @@ class TestNuclide(unittest.TestCase):
                 len(nuc.element.nuclideBases) - 1, numNaturals
             )  # , nuc)
 
+    def test_nucBases_byMassNumberMatchesWhere(self):
+        viaWhere = set(nuclideBases.where(lambda nn: nn.a == 95))
+        self.assertTrue(viaWhere)
+        self.assertEqual(set(nuclideBases.byMassNumber(95)), viaWhere)
+
+    def test_nucBases_byAtomicNumberMatchesWhere(self):
+        viaWhere = set(nuclideBases.where(lambda nn: nn.z == 92))
+        self.assertTrue(viaWhere)
+        self.assertEqual(set(nuclideBases.byAtomicNumber(92)), viaWhere)
+
+    def test_nucBases_whereVector(self):
+        _z, a, _state, _abundance, weight = nuclideBases.whereVector(
+            nuclideBases._getQueryArrays()[0] == 92  # pylint: disable=protected-access
+        )
+        expected = sorted(
+            (nn.a, nn.weight) for nn in nuclideBases.where(lambda nn: nn.z == 92)
+        )
+        self.assertEqual(sorted(zip(a, weight)), expected)
+
+    def test_nucBases_isHeavyMetalMask(self):
+        viaMask = set(nuclideBases.whereMask(nuclideBases.isHeavyMetalMask()))
+        viaWhere = set(nuclideBases.where(lambda nn: nn.isHeavyMetal()))
+        self.assertTrue(viaWhere)
+        self.assertEqual(viaMask, viaWhere)
+
     def test_nucBases_singleFailsWithMultipleMatches(self):
         with self.assertRaises(Exception):
             nuclideBases.single(lambda nuc: nuc.z == 92)
@@ -155,6 +180,12 @@ class TestNuclide(unittest.TestCase):
         self.assertEqual(235, u235.a)
         self.assertEqual(92, u235.z)
 
+    def test_nucBases_fromZAS(self):
+        self.assertIs(nuclideBases.fromZAS(92, 235), nuclideBases.byName["U235"])
+        self.assertIs(nuclideBases.fromZAS(95, 242, 1), nuclideBases.byName["AM242"])
+        with self.assertRaises(KeyError):
+            nuclideBases.fromZAS(92, 600)
+
     def test_NaturalNuclide_atomicWeightIsAverageOfNaturallyOccuringIsotopes(self):
         for natNuk in nuclideBases.where(
             lambda nn: isinstance(nn, nuclideBases.NaturalNuclideBase)
@@ -21,6 +21,7 @@ import math
 import os
 import glob
 
+import numpy
 import six
 
 from armi.utils.textProcessors import SequentialStringIOReader, SequentialReader
@@ -30,6 +31,8 @@ from armi.utils import units
 from armi.settings.caseSettings import Settings
 
 DECAY_CONSTANTS = {}
+# RIPL decay/level files are named by atomic number, e.g. z001.dat
+RIPL_DECAY_FILE_PATTERN = "z???.dat"
 MINIMUM_HALFLIFE = 1.0e-06
 STABLE_FLAG = -1
 UNKNOWN_HALFLIFE = -2
@@ -89,7 +92,12 @@ def getNuclideDecayConstants(fileName):
                         nb = nuclideBases.byAAAZZZSId.get(aaazzzs, False)
                         if not nb:
                             nb = nuclideBases.NuclideBase(
-                                elements.byZ[int(z)], int(a), float(a), 0, int(m), None
+                                elements.getElementByZ(int(z)),
+                                int(a),
+                                float(a),
+                                0,
+                                int(m),
+                                None,
                             )
 
                         nuclideDecayConstants[nb] = math.log(2.0) / halflife
@@ -142,33 +150,75 @@ def readFRDMMassFile(fname):
 
     The format is ``(2i4,1x,a2,1x,i1,4f10.3,4f8.3)``.
     """
-    if isinstance(fname, six.StringIO):
-        readerClass = SequentialStringIOReader
-    else:
-        readerClass = SequentialReader
-
-    with readerClass(fname) as reader:
-        while reader.searchForPattern(
-            r"^\s+(\d+)\s+(\d+)\s+(\S+)\s+(\d)\s+([-]?\d+\.\d+)\s+([-]?\d+\.\d+)"
-        ):
-            z, a, element, flag, massExcess, err = reader.match.groups()
-            if flag == "2":
-                # massExcess in MeV / (MeV/amu) = mass in amu
-                mass = float(massExcess) / units.ATOMIC_MASS_CONSTANT_MEV
-                a = int(a)
-                yield int(z), a, element, a + float(mass), float(err)
-            reader.consumeLine()
+    # parse the fixed-width columns of interest in one shot; accepts either a
+    # file path or a StringIO like the other readers in this module
+    data = numpy.genfromtxt(
+        fname,
+        delimiter=(4, 4, 3, 2, 10, 10),
+        dtype=None,
+        names=("z", "a", "symbol", "flag", "massExcess", "err"),
+        autostrip=True,
+        encoding=None,
+    )
+    measured = data[data["flag"] == 2]
+    # massExcess in MeV / (MeV/amu) = mass in amu
+    masses = measured["a"] + measured["massExcess"] / units.ATOMIC_MASS_CONSTANT_MEV
+    for row, mass in zip(measured, masses):
+        yield int(row["z"]), int(row["a"]), str(row["symbol"]), float(mass), float(
+            row["err"]
+        )
 
 
 def readAbundanceFile(stream):
     """Read RIPL natural abundance subfile."""
     for line in stream:
-        if line.startswith("#"):
+        if line.startswith("#") or not line.strip():
             continue
         z, a, sym, percent, err = line.split()
         yield int(z), int(a), sym.upper(), float(percent), float(err)
 
 
+def readMassAndAbundance(massFile, abundanceFile):
+    """
+    Read the FRDM mass file and natural abundance file in one fused pass.
+
+    The abundances are loaded into a dict first and attached to the mass
+    records as they stream by, so callers can construct nuclides with their
+    mass and natural abundance in one shot rather than mutating them in a
+    second pass over another file.
+
+    Yields
+    ------
+    z, a, symbol, mass, abundance : int, int, str, float, float
+        One entry per measured mass record, with the element symbol upper-cased
+        and the abundance as an atom fraction (0.0 for non-natural nuclides).
+
+    Raises
+    ------
+    KeyError
+        If the abundance file contains a nuclide with no measured mass.
+    """
+    if isinstance(abundanceFile, six.StringIO):
+        abundances = {
+            (sym, a): percent / 100.0
+            for _z, a, sym, percent, _err in readAbundanceFile(abundanceFile)
+        }
+    else:
+        with open(abundanceFile) as stream:
+            abundances = {
+                (sym, a): percent / 100.0
+                for _z, a, sym, percent, _err in readAbundanceFile(stream)
+            }
+    for z, a, symbol, mass, _err in readFRDMMassFile(massFile):
+        symbol = symbol.upper()
+        yield z, a, symbol, mass, abundances.pop((symbol, a), 0.0)
+    if abundances:
+        raise KeyError(
+            "Natural abundances given for nuclides with no measured mass: {}"
+            "".format(sorted(abundances))
+        )
+
+
 def discoverRiplDecayFiles(directory):
     """
     Discover the RIPL decay/level files in the specified directory.
@@ -186,11 +236,9 @@ def discoverRiplDecayFiles(directory):
     riplDecayFiles : list
         file names of the RIPL decay files
     """
-    riplDecayFiles = []
-    for fileName in glob.glob(os.path.join(directory, "z???.dat")):
-        riplDecayFiles.append(os.path.join(directory, fileName))
-
-    return riplDecayFiles
+    # glob returns paths already joined with the directory; sort them so the
+    # files are processed in atomic-number order regardless of platform
+    return sorted(glob.glob(os.path.join(directory, RIPL_DECAY_FILE_PATTERN)))
 
 
 def makeDecayConstantTable(directory=None, cs=None):
@@ -114,6 +114,32 @@ class TestRipl(unittest.TestCase):
         else:
             raise ValueError("No hydrogen found")
 
+    def test_readMassAndAbundance(self):
+        mass = six.StringIO(SAMPLE_RIPL_MASS)
+        # only keep the hydrogen abundances so every abundance has a mass
+        abundance = six.StringIO(
+            "\n".join(
+                line for line in SAMPLE_RIPL_ABUNDANCE.splitlines() if "He" not in line
+            )
+        )
+        records = {
+            (z, a): (el, massVal, abund)
+            for z, a, el, massVal, abund in ripl.readMassAndAbundance(mass, abundance)
+        }
+        self.assertAlmostEqual(records[1, 1][1], 1.0078250321)
+        self.assertAlmostEqual(records[1, 1][2], 0.99985001)
+        self.assertAlmostEqual(records[1, 2][2], 0.00015)
+        self.assertEqual(records[1, 3][2], 0.0)
+
+    def test_readMassAndAbundanceUnmatched(self):
+        with self.assertRaises(KeyError):
+            # the sample mass file has no helium but the abundance file does
+            list(
+                ripl.readMassAndAbundance(
+                    six.StringIO(SAMPLE_RIPL_MASS), six.StringIO(SAMPLE_RIPL_ABUNDANCE)
+                )
+            )
+
     def test_readAbundance(self):
         inp = six.StringIO(SAMPLE_RIPL_ABUNDANCE)
         for z, a, sym, percent, _err in ripl.readAbundanceFile(inp):
@@ -727,7 +727,7 @@ class ArmiObject(metaclass=CompositeModelType):
             return allNuclidesHere
         elif isinstance(nucSpec, (str)):
             nuclideNames = [nucSpec]
-        elif isinstance(nucSpec, list):
+        elif isinstance(nucSpec, (list, tuple, set, frozenset)):
             nuclideNames = []
             for ns in nucSpec:
                 nuclideNames.extend(self._getNuclidesFromSpecifier(ns))